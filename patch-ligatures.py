@@ -11,10 +11,15 @@ Usage:
 """
 
 import copy
+import gc
 import math
+import pickle
 import sys
+from collections import deque
+import numpy as np
 from fontTools.ttLib import TTFont
 from fontTools.ttLib.tables import otTables
+from fontTools.ttLib.tables._g_l_y_f import Glyph, flagOnCurve
 from fontTools.ttLib.tables.ttProgram import Program
 from fontTools.pens.recordingPen import DecomposingRecordingPen
 from fontTools.pens.ttGlyphPen import TTGlyphPen
@@ -24,51 +29,47 @@ from fontTools.pens.ttGlyphPen import TTGlyphPen
 # Glyph manipulation
 # ---------------------------------------------------------------------------
 
-def scale_glyph(glyph, scale_x, scale_y=1.0):
-    """Scale a glyph's coordinates (simple or composite)."""
-    if glyph.isComposite():
-        for comp in glyph.components:
-            comp.x = round(comp.x * scale_x)
-            if scale_y != 1.0:
-                comp.y = round(comp.y * scale_y)
-        return
-    if glyph.numberOfContours <= 0:
-        return
-    coords = glyph.coordinates
-    new_coords = []
-    for x, y in coords:
-        new_coords.append((round(x * scale_x), round(y * scale_y)))
-    glyph.coordinates = type(coords)(new_coords)
-    # Recalculate bounds from actual coordinates (decomposed glyphs
-    # may not have xMin/xMax/yMin/yMax set yet)
-    xs = [c[0] for c in new_coords]
-    ys = [c[1] for c in new_coords]
-    glyph.xMin = min(xs)
-    glyph.xMax = max(xs)
-    glyph.yMin = min(ys)
-    glyph.yMax = max(ys)
+def _coords_array(coords):
+    """View a GlyphCoordinates buffer as an (n, 2) float array, without copying."""
+    return np.frombuffer(coords.array, dtype=np.float64).reshape(-1, 2)
 
 
-def apply_italic_slant(glyph, angle_deg):
-    """Apply italic slant transform to glyph coordinates (simple or composite)."""
-    slant = math.tan(math.radians(angle_deg))
-    if glyph.isComposite():
-        for comp in glyph.components:
-            comp.x = round(comp.x + comp.y * slant)
+def _set_bounds(glyph, arr):
+    """Set xMin/xMax/yMin/yMax from an (n, 2) coordinate array."""
+    glyph.xMin, glyph.yMin = (int(v) for v in arr.min(axis=0))
+    glyph.xMax, glyph.yMax = (int(v) for v in arr.max(axis=0))
+
+
+def _apply_affine(arr, m):
+    """Transform an (n, 2) array in place by a 2x3 affine matrix, then round."""
+    arr[:] = arr @ m[:, :2].T + m[:, 2]
+    np.rint(arr, out=arr)
+
+
+def transform_glyph(glyph, matrix):
+    """Apply a 2x3 affine matrix [[a, b, tx], [c, d, ty]] to a glyph (simple or composite).
+
+    A point (x, y) maps to (a*x + b*y + tx, c*x + d*y + ty), rounded once
+    after the full transform. For composites only the component offsets
+    move; each component keeps its own 2x2 transform, since the glyphs it
+    references are already drawn at the target size.
+    """
+    if glyph.numberOfContours == 0:
         return
-    if glyph.numberOfContours <= 0:
+    m = np.asarray(matrix, dtype=np.float64)
+    if glyph.isComposite():
+        comps = glyph.components
+        offsets = np.array([(c.x, c.y) for c in comps], dtype=np.float64)
+        _apply_affine(offsets, m)
+        for comp, (x, y) in zip(comps, offsets.astype(int).tolist()):
+            comp.x = x
+            comp.y = y
         return
-    coords = glyph.coordinates
-    new_coords = []
-    for x, y in coords:
-        new_coords.append((round(x + y * slant), y))
-    glyph.coordinates = type(coords)(new_coords)
-    xs = [c[0] for c in new_coords]
-    ys = [c[1] for c in new_coords]
-    glyph.xMin = min(xs)
-    glyph.xMax = max(xs)
-    glyph.yMin = min(ys)
-    glyph.yMax = max(ys)
+    arr = _coords_array(glyph.coordinates)
+    _apply_affine(arr, m)
+    # Recalculate bounds from actual coordinates (decomposed glyphs
+    # may not have xMin/xMax/yMin/yMax set yet)
+    _set_bounds(glyph, arr)
 
 
 def detect_italic_angle(font):
@@ -82,45 +83,93 @@ def detect_italic_angle(font):
     return 0
 
 
-def _decompose_glyph(font, glyph_name):
-    """Flatten a composite glyph into simple outlines using the source font's components."""
-    glyph_set = font.getGlyphSet()
-    rec = DecomposingRecordingPen(glyph_set)
-    glyph_set[glyph_name].draw(rec)
-    pen = TTGlyphPen(None)
+def _clone_glyph(glyph):
+    """Copy an expanded glyph for transforming, much cheaper than copy.deepcopy.
+
+    Only the coordinates (or component records) are modified afterwards,
+    so contour end points and flags are shared with the source glyph. The
+    hinting program is not copied; add_glyph gives every glyph a new one.
+    """
+    new = Glyph()
+    new.numberOfContours = glyph.numberOfContours
+    for attr in ('xMin', 'yMin', 'xMax', 'yMax'):
+        if hasattr(glyph, attr):
+            setattr(new, attr, getattr(glyph, attr))
+    if glyph.isComposite():
+        new.components = [copy.copy(comp) for comp in glyph.components]
+    elif glyph.numberOfContours > 0:
+        new.endPtsOfContours = glyph.endPtsOfContours
+        new.flags = glyph.flags
+        new.coordinates = glyph.coordinates.copy()
+    return new
+
+
+def _flatten_composite(glyph, glyf):
+    """Flatten a composite whose components are all simple glyphs.
+
+    Uses the glyf table's own component expansion, which is much cheaper
+    than replaying the outlines through a pen pipeline.
+    """
+    coords, end_pts, flags = glyph.getCoordinates(glyf)
+    new = Glyph()
+    new.numberOfContours = len(end_pts)
+    new.coordinates = coords
+    new.endPtsOfContours = list(end_pts)
+    new.flags = bytearray(f & flagOnCurve for f in flags)
+    return new
+
+
+def _make_decompose_pens(glyph_set):
+    """Create the (recording, TrueType) pen pair reused by _decompose_glyph."""
+    return DecomposingRecordingPen(glyph_set), TTGlyphPen(None)
+
+
+def _decompose_glyph(pens, glyph_name):
+    """Flatten a composite glyph into simple outlines using the source font's components.
+
+    ``pens`` comes from _make_decompose_pens() and is reused across calls:
+    the recording is cleared here and TTGlyphPen.glyph() resets itself.
+    """
+    rec, pen = pens
+    rec.value = []
+    rec.glyphSet[glyph_name].draw(rec)
     rec.replay(pen)
     return pen.glyph()
 
 
-def add_glyph(target_font, glyph_name, source_font, source_glyph_name,
-              target_width, source_width, italic_angle=0):
+def add_glyph(target_glyf, target_hmtx, glyph_name,
+              src_glyf, src_hmtx, decompose_pens, source_glyph_name,
+              target_width, source_width, glyph_order, glyph_order_set,
+              slant=0.0):
     """Copy a glyph from source font to target font with scaling.
 
     Composite glyphs are decomposed into simple outlines first, so they
     use JBM's actual drawn shapes instead of referencing the target font's
     (differently shaped) base glyphs.
-    """
-    src_glyf = source_font["glyf"]
-    src_hmtx = source_font["hmtx"]
 
+    The glyf/hmtx tables and the decomposition pens (_make_decompose_pens)
+    are passed in by the caller, so they are set up once per font rather
+    than per glyph.
+    New glyph names are appended to ``glyph_order``/``glyph_order_set``;
+    the caller commits them with a single ``setGlyphOrder()`` afterwards.
+    ``slant`` is the italic shear factor, tan(italic angle), or 0 if upright.
+    """
     src_glyph = src_glyf[source_glyph_name]
     if src_glyph.isComposite():
-        new_glyph = _decompose_glyph(source_font, source_glyph_name)
+        if any(src_glyf[c.glyphName].isComposite() for c in src_glyph.components):
+            new_glyph = _decompose_glyph(decompose_pens, source_glyph_name)
+        else:
+            new_glyph = _flatten_composite(src_glyph, src_glyf)
     else:
-        new_glyph = copy.deepcopy(src_glyph)
+        new_glyph = _clone_glyph(src_glyph)
 
     # Strip TrueType hinting instructions — they reference the source font's
     # CVT/fpgm which differ from the target font, causing garbled rendering.
     new_glyph.program = Program()
 
+    # Horizontal scale followed by the italic shear, composed into one pass
     scale_x = target_width / source_width
-    scale_glyph(new_glyph, scale_x)
-
-    if italic_angle > 0:
-        apply_italic_slant(new_glyph, italic_angle)
-
-    target_glyf = target_font["glyf"]
-    target_hmtx = target_font["hmtx"]
+    transform_glyph(new_glyph, [[scale_x, slant, 0], [0, 1.0, 0]])
 
     target_glyf.glyphs[glyph_name] = new_glyph
 
@@ -128,59 +177,71 @@ def add_glyph(target_font, glyph_name, source_font, source_glyph_name,
     new_lsb = round(src_lsb * scale_x)
     target_hmtx[glyph_name] = (target_width, new_lsb)
 
-    glyph_order = target_font.getGlyphOrder()
-    if glyph_name not in glyph_order:
-        target_font.setGlyphOrder(glyph_order + [glyph_name])
+    if glyph_name not in glyph_order_set:
+        glyph_order.append(glyph_name)
+        glyph_order_set.add(glyph_name)
 
 
 # ---------------------------------------------------------------------------
 # GSUB lookup analysis
 # ---------------------------------------------------------------------------
 
-def _unwrap(lookup, subtable):
-    """Unwrap Extension subtable to get the actual subtable."""
-    if lookup.LookupType == 7 and hasattr(subtable, 'ExtSubTable'):
-        return subtable.ExtSubTable
-    return subtable
+# Lookup types whose subtables carry SubstLookupRecords (Context and
+# ChainContext); every other type has no lookup references to remap.
+_CONTEXTUAL_LOOKUP_TYPES = (5, 6)
 
 
-def _collect_refs(subtable, refs):
-    """Collect SubstLookupRecord.LookupListIndex from a subtable."""
-    # Format 1 rule sets (ChainContextSubst / ContextSubst)
-    for rs_attr, rule_attr in [('ChainSubRuleSet', 'ChainSubRule'),
-                               ('SubRuleSet', 'SubRule')]:
-        for rs in getattr(subtable, rs_attr, None) or []:
-            if rs is None:
-                continue
-            for rule in getattr(rs, rule_attr, []):
-                for rec in getattr(rule, 'SubstLookupRecord', []):
-                    refs.add(rec.LookupListIndex)
-
-    # Format 2 class sets
-    for cs_attr, rule_attr in [('ChainSubClassSet', 'ChainSubClassRule'),
-                               ('SubClassSet', 'SubClassRule')]:
-        for cs in getattr(subtable, cs_attr, None) or []:
-            if cs is None:
-                continue
-            for rule in getattr(cs, rule_attr, []):
-                for rec in getattr(rule, 'SubstLookupRecord', []):
-                    refs.add(rec.LookupListIndex)
+def _effective_lookup_type(lookup):
+    """Get a lookup's type, looking through an Extension wrapper."""
+    if lookup.LookupType == 7 and lookup.SubTable:
+        return lookup.SubTable[0].ExtensionLookupType
+    return lookup.LookupType
 
-    # Format 3 inline SubstLookupRecord
-    for rec in getattr(subtable, 'SubstLookupRecord', None) or []:
-        refs.add(rec.LookupListIndex)
 
+def _unwrapped_subtables(lookup):
+    """Get a lookup's subtables with Extension wrappers removed."""
+    if lookup.LookupType != 7:
+        return list(lookup.SubTable)
+    return [st.ExtSubTable if hasattr(st, 'ExtSubTable') else st
+            for st in lookup.SubTable]
 
-def collect_lookup_refs(lookup):
-    """Get all lookup indices referenced by a lookup's SubstLookupRecords."""
-    refs = set()
-    for st in lookup.SubTable:
-        _collect_refs(_unwrap(lookup, st), refs)
-    return refs
+
+# (subtable type, Format) -> (rule set attribute, rule attribute).
+# Format 3 subtables carry their SubstLookupRecords inline instead.
+_RULE_ATTRS = {
+    ('ChainContextSubst', 1): ('ChainSubRuleSet', 'ChainSubRule'),
+    ('ChainContextSubst', 2): ('ChainSubClassSet', 'ChainSubClassRule'),
+    ('ContextSubst', 1): ('SubRuleSet', 'SubRule'),
+    ('ContextSubst', 2): ('SubClassSet', 'SubClassRule'),
+}
+
+
+def _subst_lookup_records(subtable):
+    """Yield every SubstLookupRecord of a (Chain)ContextSubst subtable.
+
+    The subtable format is identified once, and only the rule lists that
+    format actually uses are walked.  Other subtable types yield nothing.
+    """
+    kind = type(subtable).__name__
+    if kind not in ('ChainContextSubst', 'ContextSubst'):
+        return
+    if subtable.Format == 3:
+        yield from subtable.SubstLookupRecord
+        return
+    rs_attr, rule_attr = _RULE_ATTRS[kind, subtable.Format]
+    for rs in getattr(subtable, rs_attr) or []:
+        if rs is None:
+            continue
+        for rule in getattr(rs, rule_attr):
+            yield from rule.SubstLookupRecord
 
 
 def find_calt_lookups(gsub):
-    """Find calt feature's direct lookup indices and all transitively referenced lookups."""
+    """Find calt feature's direct lookup indices and all transitively referenced lookups.
+
+    Also returns the set of glyph names those lookups reference, gathered
+    during the same traversal.
+    """
     calt_direct = []
     for rec in gsub.table.FeatureList.FeatureRecord:
         if rec.FeatureTag == 'calt':
@@ -188,77 +249,124 @@ def find_calt_lookups(gsub):
             break
 
     if not calt_direct:
-        return [], set()
+        return [], set(), set()
 
+    # Breadth-first walk; every lookup (including self-references) is
+    # visited once, feeding each reference straight into the visited set.
+    lookups = gsub.table.LookupList.Lookup
     all_needed = set(calt_direct)
-    queue = list(calt_direct)
+    names = set()
+    queue = deque(calt_direct)
     while queue:
-        idx = queue.pop()
-        for ref in collect_lookup_refs(gsub.table.LookupList.Lookup[idx]):
-            if ref not in all_needed:
-                all_needed.add(ref)
-                queue.append(ref)
+        idx = queue.popleft()
+        for st in _unwrapped_subtables(lookups[idx]):
+            _collect_glyph_names(st, names)
+            for rec in _subst_lookup_records(st):
+                ref = rec.LookupListIndex
+                if ref not in all_needed:
+                    all_needed.add(ref)
+                    queue.append(ref)
 
-    return calt_direct, all_needed
+    return calt_direct, all_needed, names
 
 
 # ---------------------------------------------------------------------------
 # Glyph name collection from lookups
 # ---------------------------------------------------------------------------
 
-def collect_referenced_glyphs(lookups):
-    """Collect all glyph names referenced in the given lookups."""
-    names = set()
-    for lookup in lookups:
-        for st in lookup.SubTable:
-            _collect_glyph_names(_unwrap(lookup, st), names)
-    return names
+def _single_subst_glyphs(st, names):
+    names.update(st.mapping.keys())
+    names.update(st.mapping.values())
 
 
-def _collect_glyph_names(st, names):
-    """Collect glyph names from a single subtable."""
-    # Coverage
-    cov = getattr(st, 'Coverage', None)
-    if cov and hasattr(cov, 'glyphs'):
-        names.update(cov.glyphs)
+def _multiple_subst_glyphs(st, names):
+    for glyph, sequence in st.mapping.items():
+        names.add(glyph)
+        names.update(sequence)
+
 
-    # SingleSubst mapping
-    mapping = getattr(st, 'mapping', None)
-    if mapping:
-        names.update(mapping.keys())
-        names.update(mapping.values())
-
-    # LigatureSubst
-    ligs = getattr(st, 'ligatures', None)
-    if ligs:
-        for glyph, lig_list in ligs.items():
-            names.add(glyph)
-            for lig in lig_list:
-                names.update(lig.Component)
-                names.add(lig.LigGlyph)
-
-    # ChainContextSubst / ContextSubst Format 1 rules
-    for rs_attr, rule_attr in [('ChainSubRuleSet', 'ChainSubRule'),
-                               ('SubRuleSet', 'SubRule')]:
-        for rs in getattr(st, rs_attr, None) or []:
+def _alternate_subst_glyphs(st, names):
+    for glyph, alternates in st.alternates.items():
+        names.add(glyph)
+        names.update(alternates)
+
+
+def _ligature_subst_glyphs(st, names):
+    for glyph, lig_list in st.ligatures.items():
+        names.add(glyph)
+        for lig in lig_list:
+            names.update(lig.Component)
+            names.add(lig.LigGlyph)
+
+
+def _context_subst_glyphs(st, names):
+    # Format 3 has one Coverage per input position instead of a single one
+    if st.Format == 3:
+        for cov in st.Coverage:
+            names.update(cov.glyphs)
+        return
+    names.update(st.Coverage.glyphs)
+    if st.Format == 1:
+        for rs in st.SubRuleSet or []:
             if rs is None:
                 continue
-            for rule in getattr(rs, rule_attr, []):
-                for field in ('Backtrack', 'Input', 'LookAhead'):
-                    names.update(getattr(rule, field, None) or [])
-
-    # Format 2 ClassDefs
-    for attr in ('BacktrackClassDef', 'InputClassDef', 'LookAheadClassDef',
-                 'ClassDef'):
-        cd = getattr(st, attr, None)
-        if cd and hasattr(cd, 'classDefs'):
-            names.update(cd.classDefs.keys())
-
-    # Format 3 Coverages
-    for attr in ('BacktrackCoverage', 'InputCoverage', 'LookAheadCoverage'):
-        for cov in getattr(st, attr, None) or []:
-            if hasattr(cov, 'glyphs'):
+            for rule in rs.SubRule:
+                names.update(rule.Input)
+    elif st.ClassDef is not None:
+        names.update(st.ClassDef.classDefs.keys())
+
+
+def _chain_context_subst_glyphs(st, names):
+    if st.Format == 3:
+        for coverages in (st.BacktrackCoverage, st.InputCoverage,
+                          st.LookAheadCoverage):
+            for cov in coverages:
                 names.update(cov.glyphs)
+        return
+    names.update(st.Coverage.glyphs)
+    if st.Format == 1:
+        for rs in st.ChainSubRuleSet or []:
+            if rs is None:
+                continue
+            for rule in rs.ChainSubRule:
+                names.update(rule.Backtrack)
+                names.update(rule.Input)
+                names.update(rule.LookAhead)
+    else:
+        for cd in (st.BacktrackClassDef, st.InputClassDef,
+                   st.LookAheadClassDef):
+            if cd is not None:
+                names.update(cd.classDefs.keys())
+
+
+def _reverse_chain_subst_glyphs(st, names):
+    names.update(st.Coverage.glyphs)
+    for cov in st.BacktrackCoverage + st.LookAheadCoverage:
+        names.update(cov.glyphs)
+    names.update(st.Substitute)
+
+
+# Unwrapped GSUB subtable type -> glyph name extractor for that type only
+_GLYPH_COLLECTORS = {
+    'SingleSubst': _single_subst_glyphs,
+    'MultipleSubst': _multiple_subst_glyphs,
+    'AlternateSubst': _alternate_subst_glyphs,
+    'LigatureSubst': _ligature_subst_glyphs,
+    'ContextSubst': _context_subst_glyphs,
+    'ChainContextSubst': _chain_context_subst_glyphs,
+    'ReverseChainSingleSubst': _reverse_chain_subst_glyphs,
+}
+
+
+def _collect_glyph_names(st, names):
+    """Collect glyph names from a single subtable.
+
+    Dispatches on the subtable type so only the fields that type can
+    carry are read.
+    """
+    collect = _GLYPH_COLLECTORS.get(type(st).__name__)
+    if collect is not None:
+        collect(st, names)
 
 
 # ---------------------------------------------------------------------------
@@ -267,64 +375,52 @@ def _collect_glyph_names(st, names):
 
 def _remap_refs(subtable, m):
     """Remap SubstLookupRecord.LookupListIndex using mapping m."""
-    for rs_attr, rule_attr in [('ChainSubRuleSet', 'ChainSubRule'),
-                               ('SubRuleSet', 'SubRule')]:
-        for rs in getattr(subtable, rs_attr, None) or []:
-            if rs is None:
-                continue
-            for rule in getattr(rs, rule_attr, []):
-                for rec in getattr(rule, 'SubstLookupRecord', []):
-                    rec.LookupListIndex = m[rec.LookupListIndex]
-
-    for cs_attr, rule_attr in [('ChainSubClassSet', 'ChainSubClassRule'),
-                               ('SubClassSet', 'SubClassRule')]:
-        for cs in getattr(subtable, cs_attr, None) or []:
-            if cs is None:
-                continue
-            for rule in getattr(cs, rule_attr, []):
-                for rec in getattr(rule, 'SubstLookupRecord', []):
-                    rec.LookupListIndex = m[rec.LookupListIndex]
-
-    for rec in getattr(subtable, 'SubstLookupRecord', None) or []:
+    for rec in _subst_lookup_records(subtable):
         rec.LookupListIndex = m[rec.LookupListIndex]
 
 
-def remap_lookup_indices(lookup, index_map):
-    """Remap all SubstLookupRecord indices in a lookup."""
-    for st in lookup.SubTable:
-        _remap_refs(_unwrap(lookup, st), index_map)
+def remap_lookup_indices(subtables, index_map):
+    """Remap all SubstLookupRecord indices in a lookup's unwrapped subtables."""
+    for st in subtables:
+        _remap_refs(st, index_map)
 
 
 # ---------------------------------------------------------------------------
 # Main transplant logic
 # ---------------------------------------------------------------------------
 
-def transplant_calt(target, source, target_width, source_width, italic_angle):
+def transplant_calt(target, source, target_width, source_width, slant):
     """Transplant the entire calt feature from source to target font."""
     src_gsub = source["GSUB"]
 
-    # 1. Find all lookups needed by calt
-    calt_direct, all_needed = find_calt_lookups(src_gsub)
+    # 1. Find all lookups needed by calt, and the glyph names they reference
+    calt_direct, all_needed, all_glyphs = find_calt_lookups(src_gsub)
     if not calt_direct:
         print("ERROR: No calt feature found in source font")
         sys.exit(1)
 
     print(f"  calt: {len(calt_direct)} direct lookups, {len(all_needed)} total (incl. referenced)")
+    ordered = sorted(all_needed)
 
-    # 2. Deep copy the needed lookups
+    # 2. Deep copy the needed lookups. A single pickle round trip of the
+    #    whole list is much faster than copy.deepcopy on otTables objects.
     src_lookups = src_gsub.table.LookupList.Lookup
-    copied = {}
-    for idx in sorted(all_needed):
-        copied[idx] = copy.deepcopy(src_lookups[idx])
-
-    # 3. Collect all glyph names referenced by the copied lookups
-    all_glyphs = collect_referenced_glyphs(copied.values())
+    payload = pickle.dumps([src_lookups[idx] for idx in ordered],
+                           protocol=pickle.HIGHEST_PROTOCOL)
+    copied = dict(zip(ordered, pickle.loads(payload)))
 
-    # 4. Copy missing glyphs from source to target
+    # 3. Copy missing glyphs from source to target
     #    Composite glyphs are decomposed in add_glyph(), so no need to
     #    resolve component dependencies.
-    target_glyph_set = set(target.getGlyphOrder())
-    source_glyph_set = set(source.getGlyphOrder())
+    #    The target order is needed as a list anyway, so its membership set
+    #    is built from that; the source side only needs a membership view.
+    target_glyf = target["glyf"]
+    target_hmtx = target["hmtx"]
+    src_glyf = source["glyf"]
+    src_hmtx = source["hmtx"]
+    glyph_order = list(target.getGlyphOrder())
+    target_glyph_set = set(glyph_order)
+    source_glyph_set = src_glyf.glyphs.keys()
     missing = all_glyphs - target_glyph_set
     to_copy = sorted(missing & source_glyph_set)
     skipped = sorted(missing - source_glyph_set)
@@ -333,26 +429,32 @@ def transplant_calt(target, source, target_width, source_width, italic_angle):
     if skipped:
         print(f"  WARNING: {len(skipped)} glyphs not found in source: {skipped[:10]}...")
 
+    decompose_pens = _make_decompose_pens(source.getGlyphSet())
     for glyph_name in to_copy:
-        add_glyph(target, glyph_name, source, glyph_name,
-                  target_width, source_width, italic_angle)
-
-    # 5. Append lookups to target's GSUB LookupList, building index mapping
+        add_glyph(target_glyf, target_hmtx, glyph_name,
+                  src_glyf, src_hmtx, decompose_pens, glyph_name,
+                  target_width, source_width, glyph_order, target_glyph_set,
+                  slant)
+    target.setGlyphOrder(glyph_order)
+
+    # 4. Append lookups to target's GSUB LookupList, building index mapping.
+    #    Appending at the tail leaves every existing lookup index valid, so
+    #    the target's own references never need shifting.
     tgt_gsub = target["GSUB"]
-    tgt_lookups = tgt_gsub.table.LookupList.Lookup
+    tgt_lookup_list = tgt_gsub.table.LookupList
+    tgt_lookups = tgt_lookup_list.Lookup
     base_idx = len(tgt_lookups)
 
-    index_map = {}
-    for i, old_idx in enumerate(sorted(all_needed)):
-        new_idx = base_idx + i
-        index_map[old_idx] = new_idx
-        tgt_lookups.append(copied[old_idx])
+    index_map = dict(zip(ordered, range(base_idx, base_idx + len(ordered))))
+    tgt_lookups.extend(copied[old_idx] for old_idx in ordered)
+    tgt_lookup_list.LookupCount = len(tgt_lookups)
 
-    # 6. Remap internal lookup references in the copied lookups
-    for old_idx in sorted(all_needed):
-        remap_lookup_indices(copied[old_idx], index_map)
+    # 5. Remap internal lookup references in the copied lookups
+    for lookup in copied.values():
+        if _effective_lookup_type(lookup) in _CONTEXTUAL_LOOKUP_TYPES:
+            remap_lookup_indices(_unwrapped_subtables(lookup), index_map)
 
-    # 7. Create/set calt feature
+    # 6. Create/set calt feature
     new_calt_indices = [index_map[i] for i in calt_direct]
 
     calt_found = False
@@ -403,17 +505,25 @@ def main():
     italic_angle = detect_italic_angle(target)
     if italic_angle:
         print(f"Detected italic angle: {italic_angle}°")
+    slant = math.tan(math.radians(italic_angle)) if italic_angle > 0 else 0.0
 
     target_width = target["hmtx"]["equal"][0]
     source_width = source["hmtx"]["equal"][0]
     print(f"Target char width: {target_width}")
     print(f"Source char width: {source_width}")
 
-    print("Transplanting calt feature...")
-    transplant_calt(target, source, target_width, source_width, italic_angle)
-
-    print(f"Saving {output_path}...")
-    target.save(output_path)
+    # Copying lookups and compiling the font on save allocate large numbers of
+    # small, long-lived objects; keep the cyclic GC from rescanning them.
+    gc.collect()
+    gc.disable()
+    try:
+        print("Transplanting calt feature...")
+        transplant_calt(target, source, target_width, source_width, slant)
+
+        print(f"Saving {output_path}...")
+        target.save(output_path)
+    finally:
+        gc.enable()
     print("Done!")
 
 
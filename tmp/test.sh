@@ -21,7 +21,7 @@ DIST="$SCRIPT_DIR/iosevka-src/dist/$PLAN/TTF"
 if [ ! -d "$SCRIPT_DIR/venv" ]; then
     echo "==> Creating Python venv..."
     python3 -m venv "$SCRIPT_DIR/venv"
-    "$SCRIPT_DIR/venv/bin/pip" install -q fonttools brotli uharfbuzz
+    "$SCRIPT_DIR/venv/bin/pip" install -q fonttools brotli uharfbuzz numpy
 fi
 
 skip_build=false